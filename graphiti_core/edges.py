@@ -18,7 +18,7 @@ import json
 import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
-from time import time
+from time import monotonic
 from typing import Any
 from uuid import uuid4
 
@@ -282,12 +282,12 @@ class EntityEdge(Edge):
     )
 
     async def generate_embedding(self, embedder: EmbedderClient):
-        start = time()
+        start = monotonic()
 
         text = self.fact.replace('\n', ' ')
         self.fact_embedding = await embedder.create(input_data=[text])
 
-        end = time()
+        end = monotonic()
         logger.debug(f'embedded {text} in {end - start} ms')
 
         return self.fact_embedding
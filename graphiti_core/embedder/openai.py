@@ -15,14 +15,30 @@ limitations under the License.
 """
 
 import asyncio
-from collections.abc import Iterable
-from time import time
+import logging
+import math
+import random
+from collections.abc import Callable, Iterable
+from typing import Any, ClassVar
 
+import numpy as np
+import openai
+from numpy.typing import NDArray
 from openai import AsyncAzureOpenAI, AsyncOpenAI
-from openai.types import EmbeddingModel
+from openai.types import CreateEmbeddingResponse, Embedding, EmbeddingModel
 
+from ..utils.http_client import OwnedClientMixin, create_pooled_http_client
 from .client import EmbedderClient, EmbedderConfig
 
+try:
+    import tiktoken
+
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
 DEFAULT_EMBEDDING_MODEL = 'text-embedding-3-small'
 
 
@@ -32,16 +48,72 @@ class OpenAIEmbedderConfig(EmbedderConfig):
     base_url: str | None = None
     max_batch_size: int = 2048  # OpenAI's limit is 2048 texts per request
     requests_per_second: float = 50.0  # Default: 50 requests per second (for OpenAI)
+    max_concurrent_batches: int = 5  # Number of chunk requests allowed in flight at once
+    max_tokens_per_request: int = 280_000  # OpenAI's limit is 300K input tokens per request
     # Note: Qwen Embedding API has stricter rate limits, should be set to 10-20
 
 
-class OpenAIEmbedder(EmbedderClient):
+def _retry_after(error: openai.RateLimitError) -> float:
+    """Return the Retry-After delay in seconds from a rate limit error, or 0 if absent."""
+    try:
+        return float(error.response.headers.get('retry-after', 0))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _dedupe(input_data_list: list[str]) -> tuple[list[str], list[int]]:
+    """Return the distinct inputs in first-seen order and each input's index into them."""
+    seen: dict[str, int] = {}
+    idx_to_unique = [seen.setdefault(text, len(seen)) for text in input_data_list]
+    return list(seen), idx_to_unique
+
+
+class _TokenBucket:
+    """Async token bucket shared by every request issued through one embedder."""
+
+    def __init__(self, requests_per_second: float):
+        self.capacity = max(1.0, requests_per_second)
+        self.refill_rate = requests_per_second
+        self.tokens = self.capacity
+        self.last: float | None = None
+        self.lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self.lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            if self.last is not None:
+                self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.refill_rate)
+            self.last = now
+
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.refill_rate)
+                self.tokens = 0
+                self.last = loop.time()
+            else:
+                self.tokens -= 1
+
+
+class OpenAIEmbedder(OwnedClientMixin, EmbedderClient):
     """
     OpenAI Embedder Client
 
     This client supports both AsyncOpenAI and AsyncAzureOpenAI clients.
+
+    For models that accept the `dimensions` request parameter, vectors are truncated to
+    `embedding_dim` by the server instead of being downloaded at full size and sliced.
+
+    Batches that may exceed `max_tokens_per_request` are packed by token count using tiktoken
+    when it is installed (`pip install graphiti-core[perf]`), and by UTF-8 byte length
+    otherwise.
     """
 
+    # Native dimensions of models that support server-side truncation via `dimensions`
+    _DIM_PARAM_MODELS: ClassVar[dict[str, int]] = {
+        'text-embedding-3-small': 1536,
+        'text-embedding-3-large': 3072,
+    }
+
     def __init__(
         self,
         config: OpenAIEmbedderConfig | None = None,
@@ -51,57 +123,238 @@ class OpenAIEmbedder(EmbedderClient):
             config = OpenAIEmbedderConfig()
         self.config = config
 
+        self._owns_client = client is None
         if client is not None:
             self.client = client
         else:
-            self.client = AsyncOpenAI(api_key=config.api_key, base_url=config.base_url)
+            # Retries are handled by _call_with_retry, which also respects the token bucket;
+            # SDK retries on top of it would multiply the attempts per request
+            self.client = AsyncOpenAI(
+                api_key=config.api_key,
+                base_url=config.base_url,
+                max_retries=0,
+                http_client=create_pooled_http_client(),
+            )
+
+        # tiktoken encoding for embedding_model, loaded on first use; False once loading failed
+        self._encoding: Any = None
+
+        # Native dimension of the model, learned from the first response
+        self._native_dim: int | None = None
+
+        # Rate limit is enforced per embedder so concurrent callers share the budget
+        self._bucket = (
+            _TokenBucket(config.requests_per_second) if config.requests_per_second > 0 else None
+        )
+
+    async def _acquire(self) -> None:
+        if self._bucket is not None:
+            await self._bucket.acquire()
+
+    async def _call_with_retry(
+        self, input_data: Any, *, max_attempts: int = 5, **kwargs: Any
+    ) -> CreateEmbeddingResponse:
+        """Call embeddings.create, backing off on rate limits and transient server errors.
+
+        A 429 honours the server's Retry-After header when present; timeouts, connection
+        errors and 5xx responses back off exponentially. Other errors are raised immediately.
+        The embedder's own client has SDK retries disabled, so this is the only retry layer;
+        a client passed in by the caller keeps its own max_retries setting.
+        """
+        attempt = 1
+        while True:
+            await self._acquire()
+            try:
+                return await self.client.embeddings.create(input=input_data, **kwargs)
+            except openai.RateLimitError as e:
+                if attempt >= max_attempts:
+                    raise
+                delay = _retry_after(e) or min(2**attempt, 30) + random.random()
+                error: Exception = e
+            except (
+                openai.APITimeoutError,
+                openai.APIConnectionError,
+                openai.InternalServerError,
+            ) as e:
+                if attempt >= max_attempts:
+                    raise
+                delay = min(2**attempt, 30)
+                error = e
+
+            logger.warning(
+                f'Retrying embedding request in {delay:.1f}s '
+                f'(attempt {attempt}/{max_attempts}): {error}'
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _request_kwargs(self) -> dict[str, Any]:
+        """Return extra embeddings.create arguments, requesting server-side truncation when possible."""
+        dim = self.config.embedding_dim
+        native_dim = self._DIM_PARAM_MODELS.get(self.config.embedding_model)
+        if dim and native_dim is not None and dim < native_dim:
+            return {'dimensions': dim}
+        return {}
+
+    def _to_rows(self, data: list[Embedding]) -> list[list[float]]:
+        """Extract embedding vectors, truncating to embedding_dim only when it is a real cut."""
+        dim = self.config.embedding_dim
+        if self._native_dim is None and data:
+            self._native_dim = len(data[0].embedding)
+        if self._native_dim is not None and dim >= self._native_dim:
+            return [embedding.embedding for embedding in data]
+        return [embedding.embedding[:dim] for embedding in data]
 
     async def create(
         self, input_data: str | list[str] | Iterable[int] | Iterable[Iterable[int]]
     ) -> list[float]:
-        result = await self.client.embeddings.create(
-            input=input_data, model=self.config.embedding_model
+        result = await self._call_with_retry(
+            input_data, model=self.config.embedding_model, **self._request_kwargs()
         )
-        return result.data[0].embedding[: self.config.embedding_dim]
+        return self._to_rows(result.data[:1])[0]
 
-    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
-        max_batch_size = self.config.max_batch_size
-        requests_per_second = self.config.requests_per_second
-        min_interval = 1.0 / requests_per_second if requests_per_second > 0 else 0
-        
-        # For single batch or no rate limiting needed
-        if len(input_data_list) <= max_batch_size:
-            result = await self.client.embeddings.create(
-                input=input_data_list, model=self.config.embedding_model
-            )
-            return [embedding.embedding[: self.config.embedding_dim] for embedding in result.data]
-        
-        # Split into chunks of max_batch_size
-        chunks = [
-            input_data_list[i:i + max_batch_size]
-            for i in range(0, len(input_data_list), max_batch_size)
+    def _count_tokens(self, texts: list[str]) -> list[int]:
+        """Count tokens per text, using tiktoken when usable and UTF-8 length otherwise.
+
+        The UTF-8 byte length is an upper bound on the BPE token count, so the fallback never
+        under-counts. tiktoken downloads its BPE file on first use, so a failure to load or
+        encode (e.g. no access to the download host) falls back rather than failing the batch.
+        """
+        if TIKTOKEN_AVAILABLE and self._encoding is not False:
+            try:
+                if self._encoding is None:
+                    try:
+                        self._encoding = tiktoken.encoding_for_model(self.config.embedding_model)
+                    except KeyError:
+                        self._encoding = tiktoken.get_encoding('cl100k_base')
+                return [len(tokens) for tokens in self._encoding.encode_ordinary_batch(texts)]
+            except Exception as e:
+                logger.warning(f'tiktoken unavailable, counting tokens by UTF-8 length: {e}')
+                self._encoding = False
+
+        return [len(text.encode('utf-8')) for text in texts]
+
+    async def _chunk_bounds(self, input_data_list: list[str]) -> list[tuple[int, int]]:
+        """Return (start, end) bounds of the request chunks for input_data_list.
+
+        Inputs are first spread evenly over the minimum number of chunks allowed by
+        max_batch_size, so e.g. 2049 inputs become two chunks of ~1025 instead of a full chunk
+        plus a one-item tail request. Any chunk that could exceed max_tokens_per_request is
+        then packed greedily by token count; tokenizing runs in a worker thread so it does not
+        block the event loop.
+        """
+        max_tokens = self.config.max_tokens_per_request
+        num_chunks = max(1, math.ceil(len(input_data_list) / self.config.max_batch_size))
+        base_size, remainder = divmod(len(input_data_list), num_chunks)
+
+        bounds: list[tuple[int, int]] = []
+        start = 0
+        for i in range(num_chunks):
+            end = start + base_size + (1 if i < remainder else 0)
+            chunk = input_data_list[start:end]
+
+            # Byte length bounds the token count, so most chunks never need tokenizing
+            if sum(len(text.encode('utf-8')) for text in chunk) <= max_tokens:
+                bounds.append((start, end))
+            else:
+                chunk_start, chunk_tokens = start, 0
+                token_counts = await asyncio.to_thread(self._count_tokens, chunk)
+                for offset, tokens in enumerate(token_counts):
+                    index = start + offset
+                    if index > chunk_start and chunk_tokens + tokens > max_tokens:
+                        bounds.append((chunk_start, index))
+                        chunk_start, chunk_tokens = index, 0
+                    chunk_tokens += tokens
+                bounds.append((chunk_start, end))
+            start = end
+
+        return bounds
+
+    async def _dispatch_chunks(
+        self,
+        input_data_list: list[str],
+        on_chunk: Callable[[int, list[Embedding]], None],
+    ) -> None:
+        """Embed input_data_list in chunks, calling on_chunk(start, data) for each response.
+
+        `start` is the offset of the chunk in input_data_list, so callers can write results
+        straight into a preallocated output regardless of completion order.
+        """
+        call = self._call_with_retry
+        model = self.config.embedding_model
+        extra = self._request_kwargs()
+        bounds = await self._chunk_bounds(input_data_list)
+
+        # Single batch, no splitting needed
+        if len(bounds) == 1:
+            result = await call(input_data_list, model=model, **extra)
+            on_chunk(0, result.data)
+            return
+
+        # Chunks are sliced lazily by a producer and consumed by a fixed pool of workers, so
+        # the first request goes out immediately and only a few chunks exist at a time.
+        num_workers = min(max(1, self.config.max_concurrent_batches), len(bounds))
+        queue: asyncio.Queue[tuple[int, list[str]] | None] = asyncio.Queue(maxsize=num_workers * 2)
+
+        async def _produce() -> None:
+            for start, end in bounds:
+                await queue.put((start, input_data_list[start:end]))
+            for _ in range(num_workers):
+                await queue.put(None)
+
+        async def _work() -> None:
+            while (item := await queue.get()) is not None:
+                start, chunk = item
+                result = await call(chunk, model=model, **extra)
+                on_chunk(start, result.data)
+
+        tasks = [
+            asyncio.create_task(_produce()),
+            *[asyncio.create_task(_work()) for _ in range(num_workers)],
         ]
-        all_embeddings = []
-        last_request_time = time()
-        
-        for i, chunk in enumerate(chunks):
-            # Calculate time since last request
-            current_time = time()
-            time_since_last = current_time - last_request_time
-            
-            # If we need to wait to respect rate limit
-            if time_since_last < min_interval and i > 0:
-                wait_time = min_interval - time_since_last
-                await asyncio.sleep(wait_time)
-            
-            # Make the request
-            result = await self.client.embeddings.create(
-                input=chunk, model=self.config.embedding_model
-            )
-            chunk_embeddings = [embedding.embedding[: self.config.embedding_dim] for embedding in result.data]
-            all_embeddings.extend(chunk_embeddings)
-            
-            # Update last request time
-            last_request_time = time()
-        
-        return all_embeddings
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # A failed request must not leave the producer blocked on a full queue
+            for task in tasks:
+                task.cancel()
+
+    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        unique_inputs, idx_to_unique = _dedupe(input_data_list)
+        unique_embeddings: list[list[float]] = [[] for _ in unique_inputs]
+
+        def _store(start: int, data: list[Embedding]) -> None:
+            rows = self._to_rows(data)
+            unique_embeddings[start : start + len(rows)] = rows
+
+        await self._dispatch_chunks(unique_inputs, _store)
+
+        if len(unique_inputs) == len(input_data_list):
+            return unique_embeddings
+        return [unique_embeddings[j] for j in idx_to_unique]
+
+    async def create_batch_np(self, input_data_list: list[str]) -> NDArray[np.float32]:
+        """Embed a batch of inputs into a single (n, dim) float32 array.
+
+        This avoids materializing every vector as a list of Python floats, which is several
+        times larger in memory than the packed array.
+        """
+        dim = self.config.embedding_dim
+        unique_inputs, idx_to_unique = _dedupe(input_data_list)
+        out: NDArray[np.float32] | None = None
+
+        def _store(start: int, data: list[Embedding]) -> None:
+            nonlocal out
+            rows = np.asarray([embedding.embedding for embedding in data], dtype=np.float32)
+            rows = rows[:, :dim]
+            if out is None:
+                out = np.empty((len(unique_inputs), rows.shape[1]), dtype=np.float32)
+            out[start : start + len(rows)] = rows
+
+        await self._dispatch_chunks(unique_inputs, _store)
+
+        if out is None:
+            return np.empty((0, dim), dtype=np.float32)
+        if len(unique_inputs) == len(input_data_list):
+            return out
+        return out[idx_to_unique]
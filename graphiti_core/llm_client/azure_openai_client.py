@@ -22,7 +22,7 @@ from openai.types.chat import ChatCompletionMessageParam
 from pydantic import BaseModel
 
 from .config import DEFAULT_MAX_TOKENS, LLMConfig
-from .openai_base_client import BaseOpenAIClient
+from .openai_base_client import REASONING_MODEL_PREFIXES, BaseOpenAIClient
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +62,7 @@ class AzureOpenAILLMClient(BaseOpenAIClient):
         response_model: type[BaseModel],
         reasoning: str | None,
         verbosity: str | None,
+        prompt_cache_key: str | None = None,
     ):
         """Create a structured completion using Azure OpenAI's responses.parse API."""
         supports_reasoning = self._supports_reasoning_features(model)
@@ -82,6 +83,9 @@ class AzureOpenAILLMClient(BaseOpenAIClient):
         if supports_reasoning and verbosity:
             request_kwargs['text'] = {'verbosity': verbosity}  # type: ignore
 
+        if prompt_cache_key:
+            request_kwargs['extra_body'] = {'prompt_cache_key': prompt_cache_key}  # type: ignore
+
         return await self.client.responses.parse(**request_kwargs)
 
     async def _create_completion(
@@ -91,6 +95,7 @@ class AzureOpenAILLMClient(BaseOpenAIClient):
         temperature: float | None,
         max_tokens: int,
         response_model: type[BaseModel] | None = None,
+        prompt_cache_key: str | None = None,
     ):
         """Create a regular completion with JSON format using Azure OpenAI."""
         supports_reasoning = self._supports_reasoning_features(model)
@@ -106,10 +111,12 @@ class AzureOpenAILLMClient(BaseOpenAIClient):
         if temperature_value is not None:
             request_kwargs['temperature'] = temperature_value
 
+        if prompt_cache_key:
+            request_kwargs['extra_body'] = {'prompt_cache_key': prompt_cache_key}
+
         return await self.client.chat.completions.create(**request_kwargs)
 
     @staticmethod
     def _supports_reasoning_features(model: str) -> bool:
         """Return True when the Azure model supports reasoning/verbosity options."""
-        reasoning_prefixes = ('o1', 'o3', 'gpt-5')
-        return model.startswith(reasoning_prefixes)
+        return model.startswith(REASONING_MODEL_PREFIXES)
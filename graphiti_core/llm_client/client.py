@@ -14,6 +14,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import functools
 import hashlib
 import json
 import logging
@@ -58,6 +59,22 @@ def get_extraction_language_instruction(group_id: str | None = None) -> str:
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
+def _clean_text(input: str) -> str:
+    # Clean any invalid Unicode
+    cleaned = input.encode('utf-8', errors='ignore').decode('utf-8')
+
+    # Remove zero-width characters and other invisible unicode
+    zero_width = '\u200b\u200c\u200d\ufeff\u2060'
+    for char in zero_width:
+        cleaned = cleaned.replace(char, '')
+
+    # Remove control characters except newlines, returns, and tabs
+    cleaned = ''.join(char for char in cleaned if ord(char) >= 32 or char in '\n\r\t')
+
+    return cleaned
+
+
 def is_server_or_retry_error(exception):
     if isinstance(exception, RateLimitError | json.decoder.JSONDecodeError):
         return True
@@ -98,18 +115,9 @@ class LLMClient(ABC):
         Returns:
             Cleaned string safe for LLM processing
         """
-        # Clean any invalid Unicode
-        cleaned = input.encode('utf-8', errors='ignore').decode('utf-8')
-
-        # Remove zero-width characters and other invisible unicode
-        zero_width = '\u200b\u200c\u200d\ufeff\u2060'
-        for char in zero_width:
-            cleaned = cleaned.replace(char, '')
-
-        # Remove control characters except newlines, returns, and tabs
-        cleaned = ''.join(char for char in cleaned if ord(char) >= 32 or char in '\n\r\t')
-
-        return cleaned
+        # Prompts are often resent verbatim (retries, shared system prompts), so the
+        # cleaning itself is memoized on the string.
+        return _clean_text(input)
 
     @retry(
         stop=stop_after_attempt(4),
@@ -178,22 +186,23 @@ class LLMClient(ABC):
 
         # Wrap entire operation in tracing span
         with self.tracer.start_span('llm.generate') as span:
-            attributes = {
-                'llm.provider': self._get_provider_type(),
-                'model.size': model_size.value,
-                'max_tokens': max_tokens,
-                'cache.enabled': self.cache_enabled,
-            }
-            if prompt_name:
-                attributes['prompt.name'] = prompt_name
-            span.add_attributes(attributes)
+            if span.is_recording:
+                attributes = {
+                    'llm.provider': self._get_provider_type(),
+                    'model.size': model_size.value,
+                    'max_tokens': max_tokens,
+                    'cache.enabled': self.cache_enabled,
+                }
+                if prompt_name:
+                    attributes['prompt.name'] = prompt_name
+                span.add_attributes(attributes)
 
             # Check cache first
             if self.cache_enabled and self.cache_dir is not None:
                 cache_key = self._get_cache_key(messages)
                 cached_response = self.cache_dir.get(cache_key)
                 if cached_response is not None:
-                    logger.debug(f'Cache hit for {cache_key}')
+                    logger.debug('Cache hit for %s', cache_key)
                     span.add_attributes({'cache.hit': True})
                     return cached_response
 
@@ -18,6 +18,7 @@ from enum import Enum
 
 DEFAULT_MAX_TOKENS = 8192
 DEFAULT_TEMPERATURE = 1
+DEFAULT_MAX_CONCURRENT_REQUESTS = 20
 
 
 class ModelSize(Enum):
@@ -32,6 +33,9 @@ class LLMConfig:
     This class encapsulates the necessary parameters to interact with an LLM API,
     such as OpenAI's GPT models. It stores the API key, model name, and base URL
     for making requests to the LLM service.
+
+    The OpenAI-compatible clients parse responses and build cache keys with orjson when it is
+    installed (`pip install graphiti-core[perf]`), falling back to the standard json module.
     """
 
     def __init__(
@@ -43,6 +47,8 @@ class LLMConfig:
         max_tokens: int = DEFAULT_MAX_TOKENS,
         small_model: str | None = None,
         responses_url: str | None = None,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        use_prompt_cache_key: bool = False,
     ):
         """
         Initialize the LLMConfig with the provided parameters.
@@ -63,6 +69,16 @@ class LLMConfig:
                 
                 responses_url (str, optional): The base URL specifically for the responses.parse API endpoint.
                                                If not provided, uses the same base_url for all endpoints.
+
+                max_concurrent_requests (int, optional): The maximum number of requests an OpenAI-compatible client
+                                               (OpenAI, Azure OpenAI, DeepSeek, Qwen) keeps in flight across all of
+                                               its callers, and the default concurrency of generate_responses.
+                                               Defaults to 20.
+
+                use_prompt_cache_key (bool, optional): Whether to send the prompt name as `prompt_cache_key`, which
+                                               OpenAI uses to route requests sharing a prompt template to the same
+                                               prompt cache. Leave off for OpenAI-compatible endpoints and Azure
+                                               api-versions that reject unknown request fields. Defaults to False.
         """
         self.base_url = base_url
         self.api_key = api_key
@@ -71,3 +87,5 @@ class LLMConfig:
         self.temperature = temperature
         self.max_tokens = max_tokens
         self.responses_url = responses_url
+        self.max_concurrent_requests = max_concurrent_requests
+        self.use_prompt_cache_key = use_prompt_cache_key
@@ -14,30 +14,130 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
+import hashlib
 import json
 import logging
+import reprlib
 import typing
 from abc import abstractmethod
+from collections.abc import AsyncIterator
 from typing import Any, ClassVar
 
 import openai
+from openai import AsyncOpenAI
 from openai.types.chat import ChatCompletionMessageParam
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from ..prompts.models import Message
+from ..utils.http_client import OwnedClientMixin
 from .client import LLMClient, get_extraction_language_instruction
 from .config import DEFAULT_MAX_TOKENS, LLMConfig, ModelSize
 from .errors import RateLimitError, RefusalError
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the same exception
+_json_loads: typing.Callable[[str], Any] = orjson.loads if ORJSON_AVAILABLE else json.loads
+
 DEFAULT_MODEL = 'gpt-4.1-mini'
 DEFAULT_SMALL_MODEL = 'gpt-4.1-nano'
 DEFAULT_REASONING = 'minimal'
 DEFAULT_VERBOSITY = 'low'
 
+# Reasoning models (gpt-5 family) don't support temperature
+REASONING_MODEL_PREFIXES = ('gpt-5', 'o1', 'o3')
+
+# Bounds error text in logs: validation and decode errors can embed the entire LLM output
+_log_repr = reprlib.Repr()
+_log_repr.maxstring = 500
+_log_repr.maxother = 500
+
+_OPENAI_ROLES: frozenset[str] = frozenset({'user', 'system'})
+
+_SCHEMA_INSTRUCTION_PREFIX = '\n\nYour response must be valid JSON that matches this schema:\n'
+
+# Rendered schema instructions, keyed by response model class
+_SCHEMA_CACHE: dict[type[BaseModel], str] = {}
+
+_RETRY_TEMPLATE = (
+    'The previous response attempt was invalid. '
+    'Error type: {cls}. '
+    'Error details: {msg}. '
+    'Please try again with a valid response, ensuring the output matches '
+    'the expected format and constraints.'
+)
+
+
+def _schema_instruction(model_cls: type[BaseModel]) -> str:
+    """Return the JSON schema instruction for model_cls, rendering it only once per class."""
+    instruction = _SCHEMA_CACHE.get(model_cls)
+    if instruction is None:
+        schema = TypeAdapter(model_cls).json_schema()
+        instruction = _SCHEMA_INSTRUCTION_PREFIX + json.dumps(schema, indent=2, ensure_ascii=True)
+        _SCHEMA_CACHE[model_cls] = instruction
+    return instruction
+
 
-class BaseOpenAIClient(LLMClient):
+class _JSONListStream:
+    """Incrementally decode the items of the first JSON array in a streamed response.
+
+    Text is fed in as it arrives; each call to feed returns the array items that have been
+    fully received since the previous call. Consumed text is dropped, so only the item
+    currently being received is buffered.
+    """
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._in_array = False
+        self._done = False
+
+    def feed(self, text: str) -> list[Any]:
+        items: list[Any] = []
+        if self._done:
+            return items
+
+        buffer = self._buffer + text
+        pos = 0
+        if not self._in_array:
+            start = buffer.find('[')
+            if start < 0:
+                self._buffer = buffer
+                return items
+            self._in_array = True
+            pos = start + 1
+
+        while True:
+            while pos < len(buffer) and buffer[pos] in ' \t\n\r,':
+                pos += 1
+            if pos >= len(buffer):
+                break
+            if buffer[pos] == ']':
+                self._done = True
+                break
+            try:
+                item, end = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break
+            # A scalar at the very end of the buffer may still be truncated (e.g. a number)
+            if end >= len(buffer):
+                break
+            items.append(item)
+            pos = end
+
+        self._buffer = buffer[pos:]
+        return items
+
+
+class BaseOpenAIClient(OwnedClientMixin, LLMClient):
     """
     Base client class for OpenAI-compatible APIs (OpenAI and Azure OpenAI).
 
@@ -47,6 +147,13 @@ class BaseOpenAIClient(LLMClient):
 
     # Class-level constants
     MAX_RETRIES: ClassVar[int] = 2
+    # Whether _create_structured_completion returns a responses.parse result. Providers without
+    # that endpoint produce chat completions, which are parsed directly.
+    supports_responses_parse: ClassVar[bool] = True
+    # Provider limit on max_tokens per request, if any; larger requests are capped to it
+    max_tokens_limit: ClassVar[int | None] = None
+
+    client: AsyncOpenAI
 
     def __init__(
         self,
@@ -56,9 +163,6 @@ class BaseOpenAIClient(LLMClient):
         reasoning: str | None = DEFAULT_REASONING,
         verbosity: str | None = DEFAULT_VERBOSITY,
     ):
-        if cache:
-            raise NotImplementedError('Caching is not implemented for OpenAI-based clients')
-
         if config is None:
             config = LLMConfig()
 
@@ -66,6 +170,19 @@ class BaseOpenAIClient(LLMClient):
         self.max_tokens = max_tokens
         self.reasoning = reasoning
         self.verbosity = verbosity
+        # A client talks to one or two models for its whole lifetime, so the prefix check is
+        # done once per model name rather than on every request
+        self._reasoning_models: dict[str, bool] = {}
+        # Bounds requests in flight across all callers sharing this client
+        self._semaphore = asyncio.Semaphore(config.max_concurrent_requests)
+
+    def _is_reasoning_model(self, model: str) -> bool:
+        """Return whether model is a reasoning model (no temperature, supports reasoning effort)."""
+        is_reasoning = self._reasoning_models.get(model)
+        if is_reasoning is None:
+            is_reasoning = model.startswith(REASONING_MODEL_PREFIXES)
+            self._reasoning_models[model] = is_reasoning
+        return is_reasoning
 
     @abstractmethod
     async def _create_completion(
@@ -75,8 +192,13 @@ class BaseOpenAIClient(LLMClient):
         temperature: float | None,
         max_tokens: int,
         response_model: type[BaseModel] | None = None,
+        prompt_cache_key: str | None = None,
     ) -> Any:
-        """Create a completion using the specific client implementation."""
+        """Create a completion using the specific client implementation.
+
+        prompt_cache_key groups requests sharing a prompt template for providers with keyed
+        prompt caching; implementations for providers without it may ignore it.
+        """
         pass
 
     @abstractmethod
@@ -89,23 +211,103 @@ class BaseOpenAIClient(LLMClient):
         response_model: type[BaseModel],
         reasoning: str | None,
         verbosity: str | None,
+        prompt_cache_key: str | None = None,
     ) -> Any:
         """Create a structured completion using the specific client implementation."""
         pass
 
+    async def _chat_json(
+        self,
+        model: str,
+        messages: list[ChatCompletionMessageParam],
+        temperature: float | None,
+        max_tokens: int,
+        prompt_cache_key: str | None = None,
+        stream: bool = False,
+    ) -> Any:
+        """Issue a JSON-mode chat completion, or open a stream of one when stream is set.
+
+        Temperature is dropped for reasoning models, which don't support it.
+        """
+        return await self.client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature if not self._is_reasoning_model(model) else None,
+            max_tokens=max_tokens,
+            response_format={'type': 'json_object'},
+            extra_body={'prompt_cache_key': prompt_cache_key} if prompt_cache_key else None,
+            **({'stream': True} if stream else {}),
+        )
+
+    def _cap_max_tokens(self, model: str, requested: int) -> int:
+        """Cap max_tokens at the provider's limit."""
+        limit = self.max_tokens_limit
+        if limit is not None and requested > limit:
+            logger.warning(
+                '%s max_tokens capped at %d for model %s (requested %d)',
+                type(self).__name__,
+                limit,
+                model,
+                requested,
+            )
+            return limit
+        return requested
+
+    @staticmethod
+    def _add_schema_instruction(
+        messages: list[ChatCompletionMessageParam], response_model: type[BaseModel]
+    ) -> list[ChatCompletionMessageParam]:
+        """Return messages with response_model's JSON schema appended to the last user message.
+
+        For providers without native structured output. The instruction goes into a copy of
+        the last message, leaving the caller's message dicts untouched.
+        """
+        if not messages or messages[-1].get('role') != 'user':
+            return list(messages)
+        last_message = messages[-1]
+        content = last_message.get('content') or ''
+        new_last_message = typing.cast(
+            ChatCompletionMessageParam,
+            {**last_message, 'content': content + _schema_instruction(response_model)},
+        )
+        return [*messages[:-1], new_last_message]
+
     def _convert_messages_to_openai_format(
         self, messages: list[Message]
     ) -> list[ChatCompletionMessageParam]:
         """Convert internal Message format to OpenAI ChatCompletionMessageParam format."""
         openai_messages: list[ChatCompletionMessageParam] = []
+        append = openai_messages.append
+        clean = self._clean_input
         for m in messages:
-            m.content = self._clean_input(m.content)
-            if m.role == 'user':
-                openai_messages.append({'role': 'user', 'content': m.content})
-            elif m.role == 'system':
-                openai_messages.append({'role': 'system', 'content': m.content})
+            # Other roles are dropped, so only clean messages that are actually sent. The
+            # cleaned text goes into the outgoing dict rather than back onto the caller's Message.
+            if m.role in _OPENAI_ROLES:
+                message = {'role': m.role, 'content': clean(m.content)}
+                append(typing.cast(ChatCompletionMessageParam, message))
         return openai_messages
 
+    def _get_response_cache_key(
+        self,
+        messages: list[Message],
+        response_model: type[BaseModel] | None,
+        max_tokens: int,
+        model_size: ModelSize,
+    ) -> str:
+        """Create a cache key covering everything that determines the response."""
+        key_data = [
+            self._get_model_for_size(model_size),
+            [m.model_dump() for m in messages],
+            response_model.__name__ if response_model else None,
+            max_tokens,
+            self.temperature,
+        ]
+        if ORJSON_AVAILABLE:
+            key_bytes = orjson.dumps(key_data, option=orjson.OPT_SORT_KEYS)
+        else:
+            key_bytes = json.dumps(key_data, sort_keys=True).encode()
+        return hashlib.blake2b(key_bytes, digest_size=16).hexdigest()
+
     def _get_model_for_size(self, model_size: ModelSize) -> str:
         """Get the appropriate model name based on the requested size."""
         if model_size == ModelSize.small:
@@ -119,9 +321,9 @@ class BaseOpenAIClient(LLMClient):
         
         # First try direct parsing
         try:
-            return json.loads(json_str)
+            return _json_loads(json_str)
         except json.JSONDecodeError as e:
-            logger.debug(f'Initial JSON parse failed: {e}')
+            logger.debug('Initial JSON parse failed: %s', e)
             
         # Try common fixes
         cleaned = json_str
@@ -148,9 +350,9 @@ class BaseOpenAIClient(LLMClient):
         
         # Try parsing again
         try:
-            return json.loads(cleaned)
+            return _json_loads(cleaned)
         except json.JSONDecodeError as e:
-            logger.error(f'Failed to parse JSON even after cleaning: {cleaned[:200]}...')
+            logger.error('Failed to parse JSON even after cleaning: %s', _log_repr.repr(cleaned))
             raise Exception(f'Invalid JSON response from LLM: {e}')
 
     def _handle_structured_response(self, response: Any) -> dict[str, Any]:
@@ -161,9 +363,15 @@ class BaseOpenAIClient(LLMClient):
         """
         # Handle responses.parse format (OpenAI native)
         if hasattr(response, 'output_text'):
+            # responses.parse has already decoded and validated the output against the
+            # response model, so reuse that instead of decoding output_text a second time
+            output_parsed = getattr(response, 'output_parsed', None)
+            if isinstance(output_parsed, BaseModel):
+                return output_parsed.model_dump(mode='json')
+
             response_object = response.output_text
             if response_object:
-                return json.loads(response_object)
+                return _json_loads(response_object)
             elif hasattr(response_object, 'refusal') and response_object.refusal:
                 raise RefusalError(response_object.refusal)
             else:
@@ -171,21 +379,72 @@ class BaseOpenAIClient(LLMClient):
 
         # Handle chat.completions format (OpenAI-compatible APIs like Qwen, DeepSeek)
         elif hasattr(response, 'choices') and len(response.choices) > 0:
-            content = response.choices[0].message.content
-            if content:
-                return self._try_parse_json(content)
-            elif hasattr(response.choices[0].message, 'refusal') and response.choices[0].message.refusal:
-                raise RefusalError(response.choices[0].message.refusal)
-            else:
-                raise Exception(f'Invalid response from LLM: no content in response')
+            return self._parse_chat_completion(response, allow_empty=False)
 
         else:
             raise Exception(f'Unsupported response format: {type(response)}')
 
     def _handle_json_response(self, response: Any) -> dict[str, Any]:
         """Handle JSON response parsing."""
-        result = response.choices[0].message.content or '{}'
-        return self._try_parse_json(result)
+        return self._parse_chat_completion(response, allow_empty=True)
+
+    def _parse_chat_completion(self, response: Any, allow_empty: bool) -> dict[str, Any]:
+        """Parse the JSON content of a chat.completions response.
+
+        An empty message is treated as an empty object when allow_empty is set, and as a
+        refusal or invalid response otherwise.
+        """
+        message = response.choices[0].message
+        content = message.content
+        if content:
+            return self._try_parse_json(content)
+        if allow_empty:
+            return {}
+
+        refusal = getattr(message, 'refusal', None)
+        if refusal:
+            raise RefusalError(refusal)
+        raise Exception('Invalid response from LLM: no content in response')
+
+    async def _generate_structured(
+        self,
+        messages: list[ChatCompletionMessageParam],
+        model: str,
+        max_tokens: int,
+        response_model: type[BaseModel],
+        prompt_cache_key: str | None = None,
+    ) -> dict[str, Any]:
+        """Request and parse a completion validated against response_model."""
+        response = await self._create_structured_completion(
+            model=model,
+            messages=messages,
+            temperature=self.temperature,
+            max_tokens=max_tokens,
+            response_model=response_model,
+            reasoning=self.reasoning,
+            verbosity=self.verbosity,
+            prompt_cache_key=prompt_cache_key,
+        )
+        if not self.supports_responses_parse:
+            return self._parse_chat_completion(response, allow_empty=False)
+        return self._handle_structured_response(response)
+
+    async def _generate_unstructured(
+        self,
+        messages: list[ChatCompletionMessageParam],
+        model: str,
+        max_tokens: int,
+        prompt_cache_key: str | None = None,
+    ) -> dict[str, Any]:
+        """Request and parse a free-form JSON completion."""
+        response = await self._create_completion(
+            model=model,
+            messages=messages,
+            temperature=self.temperature,
+            max_tokens=max_tokens,
+            prompt_cache_key=prompt_cache_key,
+        )
+        return self._handle_json_response(response)
 
     async def _generate_response(
         self,
@@ -193,31 +452,28 @@ class BaseOpenAIClient(LLMClient):
         response_model: type[BaseModel] | None = None,
         max_tokens: int = DEFAULT_MAX_TOKENS,
         model_size: ModelSize = ModelSize.medium,
+        prompt_name: str | None = None,
     ) -> dict[str, Any]:
         """Generate a response using the appropriate client implementation."""
         openai_messages = self._convert_messages_to_openai_format(messages)
         model = self._get_model_for_size(model_size)
+        max_tokens = max_tokens or self.max_tokens
+        # Servers that reject unknown body fields would fail every request, so it's opt-in
+        prompt_cache_key = prompt_name if self.config.use_prompt_cache_key else None
 
         try:
-            if response_model:
-                response = await self._create_structured_completion(
-                    model=model,
-                    messages=openai_messages,
-                    temperature=self.temperature,
-                    max_tokens=max_tokens or self.max_tokens,
-                    response_model=response_model,
-                    reasoning=self.reasoning,
-                    verbosity=self.verbosity,
-                )
-                return self._handle_structured_response(response)
-            else:
-                response = await self._create_completion(
-                    model=model,
-                    messages=openai_messages,
-                    temperature=self.temperature,
-                    max_tokens=max_tokens or self.max_tokens,
+            async with self._semaphore:
+                if response_model is None:
+                    return await self._generate_unstructured(
+                        openai_messages, model, max_tokens, prompt_cache_key=prompt_cache_key
+                    )
+                return await self._generate_structured(
+                    openai_messages,
+                    model,
+                    max_tokens,
+                    response_model,
+                    prompt_cache_key=prompt_cache_key,
                 )
-                return self._handle_json_response(response)
 
         except openai.LengthFinishReasonError as e:
             raise Exception(f'Output length exceeded max tokens {self.max_tokens}: {e}') from e
@@ -225,7 +481,7 @@ class BaseOpenAIClient(LLMClient):
             raise RateLimitError from e
         except openai.AuthenticationError as e:
             logger.error(
-                f'OpenAI Authentication Error: {e}. Please verify your API key is correct.'
+                'OpenAI Authentication Error: %s. Please verify your API key is correct.', e
             )
             raise
         except Exception as e:
@@ -233,12 +489,112 @@ class BaseOpenAIClient(LLMClient):
             error_msg = str(e)
             if 'Connection error' in error_msg or 'connection' in error_msg.lower():
                 logger.error(
-                    f'Connection error communicating with OpenAI API. Please check your network connection and API key. Error: {e}'
+                    'Connection error communicating with OpenAI API. Please check your network '
+                    'connection and API key. Error: %s',
+                    e,
                 )
             else:
-                logger.error(f'Error in generating LLM response: {e}')
+                logger.error('Error in generating LLM response: %s', _log_repr.repr(error_msg))
             raise
 
+    async def stream_response(
+        self,
+        messages: list[Message],
+        max_tokens: int | None = None,
+        model_size: ModelSize = ModelSize.medium,
+        group_id: str | None = None,
+        prompt_name: str | None = None,
+    ) -> AsyncIterator[Any]:
+        """Stream a JSON response, yielding the items of its list as each one completes.
+
+        Intended for large extraction outputs shaped like {"extracted_entities": [...]}:
+        downstream work can start on the first item before the response has finished, and
+        the full response is never held in memory. Items are not validated against a response
+        model; use generate_response when the complete, validated result is needed.
+
+        Like generate_response, the request carries the multilingual instruction, is capped at
+        the provider's max_tokens limit and holds a slot of the client's concurrency limit
+        until the stream is exhausted or closed. Unlike it, a failed stream is not retried:
+        items already yielded cannot be taken back, so the error is raised to the caller.
+
+        A consumer that stops early should close the generator (e.g. with
+        contextlib.aclosing) so the HTTP response and the concurrency slot are released
+        immediately rather than when the generator is garbage-collected.
+        """
+        model = self._get_model_for_size(model_size)
+        max_tokens = self._cap_max_tokens(model, max_tokens or self.max_tokens)
+        request_messages = self._with_language_instruction(messages, group_id)
+        prompt_cache_key = prompt_name if self.config.use_prompt_cache_key else None
+
+        async with self._semaphore:
+            stream = await self._chat_json(
+                model,
+                self._convert_messages_to_openai_format(request_messages),
+                self.temperature,
+                max_tokens,
+                prompt_cache_key=prompt_cache_key,
+                stream=True,
+            )
+            try:
+                parser = _JSONListStream()
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    content = chunk.choices[0].delta.content
+                    if content:
+                        for item in parser.feed(content):
+                            yield item
+            finally:
+                await stream.close()
+
+    @staticmethod
+    def _with_language_instruction(messages: list[Message], group_id: str | None) -> list[Message]:
+        """Return a copy of messages with the multilingual extraction instruction added.
+
+        The instruction goes in a separate system message after the caller's system prompt,
+        keeping the prompt prefix cacheable and the user message last.
+        """
+        request_messages = list(messages)
+        language_instruction = get_extraction_language_instruction(group_id).strip()
+        if language_instruction:
+            insert_at = 1 if messages and messages[0].role == 'system' else 0
+            request_messages.insert(insert_at, Message(role='system', content=language_instruction))
+        return request_messages
+
+    async def generate_responses(
+        self,
+        batch: list[tuple[list[Message], type[BaseModel] | None]],
+        concurrency: int | None = None,
+        max_tokens: int | None = None,
+        model_size: ModelSize = ModelSize.medium,
+        group_id: str | None = None,
+        prompt_name: str | None = None,
+    ) -> list[dict[str, typing.Any] | BaseException]:
+        """Generate responses for independent prompts concurrently.
+
+        At most `concurrency` requests are in flight at once, defaulting to the config's
+        max_concurrent_requests. Each request goes through
+        generate_response, so per-request retries still apply. Results are returned in batch
+        order; a request that fails yields its exception in place of a response.
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.config.max_concurrent_requests)
+
+        async def _one(messages: list[Message], response_model: type[BaseModel] | None):
+            async with semaphore:
+                return await self.generate_response(
+                    messages,
+                    response_model=response_model,
+                    max_tokens=max_tokens,
+                    model_size=model_size,
+                    group_id=group_id,
+                    prompt_name=prompt_name,
+                )
+
+        return await asyncio.gather(
+            *(_one(messages, response_model) for messages, response_model in batch),
+            return_exceptions=True,
+        )
+
     async def generate_response(
         self,
         messages: list[Message],
@@ -248,23 +604,42 @@ class BaseOpenAIClient(LLMClient):
         group_id: str | None = None,
         prompt_name: str | None = None,
     ) -> dict[str, typing.Any]:
-        """Generate a response with retry logic and error handling."""
+        """Generate a response with retry logic and error handling.
+
+        The caller's system prompt is sent unchanged as the first message so that it forms a
+        stable prefix for provider-side prompt caching. Per-request content (the multilingual
+        instruction, retry feedback) is added in separate messages after it.
+        """
         if max_tokens is None:
             max_tokens = self.max_tokens
 
-        # Add multilingual extraction instructions
-        messages[0].content += get_extraction_language_instruction(group_id)
+        request_messages = self._with_language_instruction(messages, group_id)
 
         # Wrap entire operation in tracing span
         with self.tracer.start_span('llm.generate') as span:
-            attributes = {
-                'llm.provider': 'openai',
-                'model.size': model_size.value,
-                'max_tokens': max_tokens,
-            }
-            if prompt_name:
-                attributes['prompt.name'] = prompt_name
-            span.add_attributes(attributes)
+            if span.is_recording:
+                attributes = {
+                    'llm.provider': 'openai',
+                    'model.size': model_size.value,
+                    'max_tokens': max_tokens,
+                    'cache.enabled': self.cache_enabled,
+                }
+                if prompt_name:
+                    attributes['prompt.name'] = prompt_name
+                span.add_attributes(attributes)
+
+            # Check cache first
+            cache_key = None
+            if self.cache_enabled and self.cache_dir is not None:
+                cache_key = self._get_response_cache_key(
+                    request_messages, response_model, max_tokens, model_size
+                )
+                cached_response = self.cache_dir.get(cache_key)
+                if cached_response is not None:
+                    logger.debug('Cache hit for %s', cache_key)
+                    span.add_attributes({'cache.hit': True})
+                    return cached_response
+                span.add_attributes({'cache.hit': False})
 
             retry_count = 0
             last_error = None
@@ -272,8 +647,14 @@ class BaseOpenAIClient(LLMClient):
             while retry_count <= self.MAX_RETRIES:
                 try:
                     response = await self._generate_response(
-                        messages, response_model, max_tokens, model_size
+                        request_messages,
+                        response_model,
+                        max_tokens,
+                        model_size,
+                        prompt_name=prompt_name,
                     )
+                    if cache_key is not None and self.cache_dir is not None:
+                        self.cache_dir.set(cache_key, response)
                     return response
                 except (RateLimitError, RefusalError):
                     # These errors should not trigger retries
@@ -292,7 +673,11 @@ class BaseOpenAIClient(LLMClient):
 
                     # Don't retry if we've hit the max retries
                     if retry_count >= self.MAX_RETRIES:
-                        logger.error(f'Max retries ({self.MAX_RETRIES}) exceeded. Last error: {e}')
+                        logger.error(
+                            'Max retries (%d) exceeded. Last error: %s',
+                            self.MAX_RETRIES,
+                            _log_repr.repr(str(e)),
+                        )
                         span.set_status('error', str(e))
                         span.record_exception(e)
                         raise
@@ -300,18 +685,15 @@ class BaseOpenAIClient(LLMClient):
                     retry_count += 1
 
                     # Construct a detailed error message for the LLM
-                    error_context = (
-                        f'The previous response attempt was invalid. '
-                        f'Error type: {e.__class__.__name__}. '
-                        f'Error details: {str(e)}. '
-                        f'Please try again with a valid response, ensuring the output matches '
-                        f'the expected format and constraints.'
-                    )
+                    error_context = _RETRY_TEMPLATE.format(cls=e.__class__.__name__, msg=e)
 
                     error_message = Message(role='user', content=error_context)
-                    messages.append(error_message)
+                    request_messages.append(error_message)
                     logger.warning(
-                        f'Retrying after application error (attempt {retry_count}/{self.MAX_RETRIES}): {e}'
+                        'Retrying after application error (attempt %d/%d): %s',
+                        retry_count,
+                        self.MAX_RETRIES,
+                        _log_repr.repr(str(e)),
                     )
 
             # If we somehow get here, raise the last error
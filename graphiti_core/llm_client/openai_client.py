@@ -20,6 +20,7 @@ from openai import AsyncOpenAI
 from openai.types.chat import ChatCompletionMessageParam
 from pydantic import BaseModel
 
+from ..utils.http_client import create_pooled_http_client
 from .config import DEFAULT_MAX_TOKENS, LLMConfig
 from .openai_base_client import DEFAULT_REASONING, DEFAULT_VERBOSITY, BaseOpenAIClient
 
@@ -57,10 +58,23 @@ class OpenAIClient(BaseOpenAIClient):
         if config is None:
             config = LLMConfig()
 
+        self._owns_client = client is None
         if client is None:
-            self.client = AsyncOpenAI(api_key=config.api_key, base_url=config.base_url)
+            http_client = create_pooled_http_client()
+            self.client = AsyncOpenAI(
+                api_key=config.api_key, base_url=config.base_url, http_client=http_client
+            )
+            # responses.parse may be served from a different endpoint. That client only
+            # differs in base_url, so it shares the connection pool (and its TLS state), which
+            # aclose() releases through self.client.
+            self.responses_client = self.client
+            if config.responses_url and config.responses_url != config.base_url:
+                self.responses_client = AsyncOpenAI(
+                    api_key=config.api_key, base_url=config.responses_url, http_client=http_client
+                )
         else:
             self.client = client
+            self.responses_client = client
 
     async def _create_structured_completion(
         self,
@@ -71,34 +85,26 @@ class OpenAIClient(BaseOpenAIClient):
         response_model: type[BaseModel],
         reasoning: str | None = None,
         verbosity: str | None = None,
+        prompt_cache_key: str | None = None,
     ):
         """Create a structured completion using OpenAI's beta parse API."""
         # Reasoning models (gpt-5 family) don't support temperature
-        is_reasoning_model = (
-            model.startswith('gpt-5') or model.startswith('o1') or model.startswith('o3')
-        )
+        is_reasoning_model = self._is_reasoning_model(model)
 
+        temperature_value = temperature if not is_reasoning_model else None
+        # Only include reasoning and verbosity parameters for reasoning models
         request_kwargs = {
             'model': model,
-            'input': messages,  # type: ignore
+            'input': messages,
             'max_output_tokens': max_tokens,
-            'text_format': response_model,  # type: ignore
+            'text_format': response_model,
+            **({'temperature': temperature_value} if temperature_value is not None else {}),
+            **({'reasoning': {'effort': reasoning}} if is_reasoning_model and reasoning else {}),
+            **({'text': {'verbosity': verbosity}} if is_reasoning_model and verbosity else {}),
+            **({'extra_body': {'prompt_cache_key': prompt_cache_key}} if prompt_cache_key else {}),
         }
 
-        temperature_value = temperature if not is_reasoning_model else None
-        if temperature_value is not None:
-            request_kwargs['temperature'] = temperature_value
-
-        # Only include reasoning and verbosity parameters for reasoning models
-        if is_reasoning_model and reasoning is not None:
-            request_kwargs['reasoning'] = {'effort': reasoning}  # type: ignore
-
-        if is_reasoning_model and verbosity is not None:
-            request_kwargs['text'] = {'verbosity': verbosity}  # type: ignore
-
-        response = await self.client.responses.parse(**request_kwargs)
-
-        return response
+        return await self.responses_client.responses.parse(**request_kwargs)
 
     async def _create_completion(
         self,
@@ -109,17 +115,9 @@ class OpenAIClient(BaseOpenAIClient):
         response_model: type[BaseModel] | None = None,
         reasoning: str | None = None,
         verbosity: str | None = None,
+        prompt_cache_key: str | None = None,
     ):
         """Create a regular completion with JSON format."""
-        # Reasoning models (gpt-5 family) don't support temperature
-        is_reasoning_model = (
-            model.startswith('gpt-5') or model.startswith('o1') or model.startswith('o3')
-        )
-
-        return await self.client.chat.completions.create(
-            model=model,
-            messages=messages,
-            temperature=temperature if not is_reasoning_model else None,
-            max_tokens=max_tokens,
-            response_format={'type': 'json_object'},
+        return await self._chat_json(
+            model, messages, temperature, max_tokens, prompt_cache_key=prompt_cache_key
         )
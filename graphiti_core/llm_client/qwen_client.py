@@ -15,12 +15,13 @@ limitations under the License.
 """
 
 import typing
-from typing import Any
+from typing import ClassVar
 
 from openai import AsyncOpenAI
 from openai.types.chat import ChatCompletionMessageParam
 from pydantic import BaseModel
 
+from ..utils.http_client import create_pooled_http_client
 from .config import DEFAULT_MAX_TOKENS, LLMConfig
 from .openai_base_client import DEFAULT_REASONING, DEFAULT_VERBOSITY, BaseOpenAIClient
 
@@ -37,6 +38,11 @@ class QwenClient(BaseOpenAIClient):
         client (AsyncOpenAI): The OpenAI-compatible client used to interact with the API.
     """
 
+    # DashScope's responses.parse is not compatible; structured output uses chat completions
+    supports_responses_parse: ClassVar[bool] = False
+    # Qwen has a max_tokens limit of 8192 for most models
+    max_tokens_limit: ClassVar[int | None] = 8192
+
     def __init__(
         self,
         config: LLMConfig | None = None,
@@ -59,8 +65,13 @@ class QwenClient(BaseOpenAIClient):
         if config is None:
             config = LLMConfig()
 
+        self._owns_client = client is None
         if client is None:
-            self.client = AsyncOpenAI(api_key=config.api_key, base_url=config.base_url)
+            self.client = AsyncOpenAI(
+                api_key=config.api_key,
+                base_url=config.base_url,
+                http_client=create_pooled_http_client(),
+            )
         else:
             self.client = client
 
@@ -73,6 +84,7 @@ class QwenClient(BaseOpenAIClient):
         response_model: type[BaseModel],
         reasoning: str | None = None,
         verbosity: str | None = None,
+        prompt_cache_key: str | None = None,
     ):
         """Create a structured completion using chat completions with JSON format.
 
@@ -80,43 +92,10 @@ class QwenClient(BaseOpenAIClient):
         OpenAI's structured output format. We use the standard chat completions
         endpoint with JSON format instead.
         """
-        import json
-        import logging
-        from pydantic import TypeAdapter
-
-        logger = logging.getLogger(__name__)
-
-        # Qwen has a max_tokens limit of 8192 for most models
-        qwen_max_limit = 8192
+        max_tokens = self._cap_max_tokens(model, max_tokens)
+        enhanced_messages = self._add_schema_instruction(messages, response_model)
 
-        # Cap max_tokens at the provider's limit
-        if max_tokens > qwen_max_limit:
-            logger.warning(
-                f'Qwen max_tokens capped at {qwen_max_limit} for model {model} (requested {max_tokens})'
-            )
-            max_tokens = qwen_max_limit
-
-        # Generate JSON schema from the response model
-        schema = TypeAdapter(response_model).json_schema()
-
-        # Add JSON schema instruction to the last message
-        enhanced_messages = list(messages)
-        if enhanced_messages and enhanced_messages[-1].get('role') == 'user':
-            last_message = enhanced_messages[-1]
-            content = last_message.get('content', '')
-            schema_json = json.dumps(schema, indent=2, ensure_ascii=True)
-            instruction = f'\n\nYour response must be valid JSON that matches this schema:\n{schema_json}'
-            last_message['content'] = content + instruction
-
-        response = await self.client.chat.completions.create(
-            model=model,
-            messages=enhanced_messages,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            response_format={'type': 'json_object'},
-        )
-
-        return response
+        return await self._chat_json(model, enhanced_messages, temperature, max_tokens)
 
     async def _create_completion(
         self,
@@ -127,31 +106,9 @@ class QwenClient(BaseOpenAIClient):
         response_model: type[BaseModel] | None = None,
         reasoning: str | None = None,
         verbosity: str | None = None,
+        prompt_cache_key: str | None = None,
     ):
         """Create a regular completion with JSON format."""
-        import logging
-
-        logger = logging.getLogger(__name__)
+        max_tokens = self._cap_max_tokens(model, max_tokens)
 
-        # Qwen has a max_tokens limit of 8192 for most models
-        qwen_max_limit = 8192
-
-        # Cap max_tokens at the provider's limit
-        if max_tokens > qwen_max_limit:
-            logger.warning(
-                f'Qwen max_tokens capped at {qwen_max_limit} for model {model} (requested {max_tokens})'
-            )
-            max_tokens = qwen_max_limit
-
-        # Reasoning models (gpt-5 family) don't support temperature
-        is_reasoning_model = (
-            model.startswith('gpt-5') or model.startswith('o1') or model.startswith('o3')
-        )
-
-        return await self.client.chat.completions.create(
-            model=model,
-            messages=messages,
-            temperature=temperature if not is_reasoning_model else None,
-            max_tokens=max_tokens,
-            response_format={'type': 'json_object'},
-        )
\ No newline at end of file
+        return await self._chat_json(model, messages, temperature, max_tokens)
\ No newline at end of file
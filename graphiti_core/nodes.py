@@ -19,7 +19,7 @@ import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import Enum
-from time import time
+from time import monotonic
 from typing import Any
 from uuid import uuid4
 
@@ -487,10 +487,10 @@ class EntityNode(Node):
     )
 
     async def generate_name_embedding(self, embedder: EmbedderClient):
-        start = time()
+        start = monotonic()
         text = self.name.replace('\n', ' ')
         self.name_embedding = await embedder.create(input_data=[text])
-        end = time()
+        end = monotonic()
         logger.debug(f'embedded {text} in {end - start} ms')
 
         return self.name_embedding
@@ -692,10 +692,10 @@ class CommunityNode(Node):
         return result
 
     async def generate_name_embedding(self, embedder: EmbedderClient):
-        start = time()
+        start = monotonic()
         text = self.name.replace('\n', ' ')
         self.name_embedding = await embedder.create(input_data=[text])
-        end = time()
+        end = monotonic()
         logger.debug(f'embedded {text} in {end - start} ms')
 
         return self.name_embedding
@@ -33,6 +33,11 @@ except ImportError:
 class TracerSpan(ABC):
     """Abstract base class for tracer spans."""
 
+    @property
+    def is_recording(self) -> bool:
+        """Whether data added to the span is kept; callers can skip building it otherwise."""
+        return True
+
     @abstractmethod
     def add_attributes(self, attributes: dict[str, Any]) -> None:
         """Add attributes to the span."""
@@ -61,6 +66,10 @@ class Tracer(ABC):
 class NoOpSpan(TracerSpan):
     """No-op span implementation that does nothing."""
 
+    @property
+    def is_recording(self) -> bool:
+        return False
+
     def add_attributes(self, attributes: dict[str, Any]) -> None:
         pass
 
@@ -86,6 +95,14 @@ class OpenTelemetrySpan(TracerSpan):
     def __init__(self, span: 'Span'):
         self._span = span
 
+    @property
+    def is_recording(self) -> bool:
+        """Whether the underlying OpenTelemetry span is recording."""
+        try:
+            return self._span.is_recording()
+        except Exception:
+            return False
+
     def add_attributes(self, attributes: dict[str, Any]) -> None:
         """Add attributes to the OpenTelemetry span."""
         try:
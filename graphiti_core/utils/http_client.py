@@ -0,0 +1,54 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from typing import Any
+
+import httpx
+from openai import DefaultAsyncHttpxClient
+
+POOL_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=60.0)
+
+
+def create_pooled_http_client() -> httpx.AsyncClient:
+    """Return an httpx client for AsyncOpenAI with a larger keep-alive connection pool.
+
+    Only the connection limits differ from the SDK's own client; its timeout and redirect
+    defaults are kept.
+    """
+    return DefaultAsyncHttpxClient(limits=POOL_LIMITS)
+
+
+class OwnedClientMixin:
+    """Lifecycle for classes that wrap an AsyncOpenAI client in `self.client`.
+
+    An instance that created its own client (i.e. none was passed in) owns its connection
+    pool; release it with `aclose()` or by using the instance as an async context manager.
+    Externally supplied clients are left open.
+    """
+
+    client: Any
+    _owns_client: bool = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool if this instance created it."""
+        if self._owns_client:
+            await self.client.close()
@@ -18,12 +18,16 @@ from collections.abc import Generator
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
+import numpy as np
+import openai
 import pytest
 
 from graphiti_core.embedder.openai import (
     DEFAULT_EMBEDDING_MODEL,
     OpenAIEmbedder,
     OpenAIEmbedderConfig,
+    _TokenBucket,
 )
 from tests.embedder.embedder_fixtures import create_embedding_values
 
@@ -90,6 +94,7 @@ async def test_create_calls_api_correctly(
     _, kwargs = mock_openai_client.embeddings.create.call_args
     assert kwargs['model'] == DEFAULT_EMBEDDING_MODEL
     assert kwargs['input'] == 'Test input'
+    assert kwargs['dimensions'] == openai_embedder.config.embedding_dim
 
     # Verify result is processed correctly
     assert result == mock_openai_response.data[0].embedding[: openai_embedder.config.embedding_dim]
@@ -122,5 +127,232 @@ async def test_create_batch_processes_multiple_inputs(
     ]
 
 
+@pytest.mark.asyncio
+async def test_create_omits_dimensions_for_unsupported_models(
+    mock_openai_client: Any, mock_openai_response: MagicMock
+) -> None:
+    """Test that the dimensions parameter is only sent to models that support it."""
+    config = OpenAIEmbedderConfig(api_key='test_api_key', embedding_model='text-embedding-ada-002')
+    embedder = OpenAIEmbedder(config=config, client=mock_openai_client)
+    mock_openai_client.embeddings.create.return_value = mock_openai_response
+
+    await embedder.create('Test input')
+
+    _, kwargs = mock_openai_client.embeddings.create.call_args
+    assert 'dimensions' not in kwargs
+
+
+@pytest.mark.asyncio
+async def test_create_batch_embeds_duplicates_once(
+    openai_embedder: OpenAIEmbedder, mock_openai_client: Any
+) -> None:
+    """Test that duplicate inputs are sent once and their results scattered back."""
+    mock_result = MagicMock()
+    mock_result.data = [create_openai_embedding(0.1), create_openai_embedding(0.2)]
+    mock_openai_client.embeddings.create.return_value = mock_result
+
+    result = await openai_embedder.create_batch(['Header', 'Body', 'Header'])
+
+    _, kwargs = mock_openai_client.embeddings.create.call_args
+    assert kwargs['input'] == ['Header', 'Body']
+    assert [embedding[0] for embedding in result] == [0.1, 0.2, 0.1]
+
+
+@pytest.mark.asyncio
+async def test_create_batch_splits_into_concurrent_chunks(
+    openai_embedder: OpenAIEmbedder, mock_openai_client: Any
+) -> None:
+    """Test that create_batch splits large inputs into chunks and preserves input order."""
+    openai_embedder.config.max_batch_size = 2
+    openai_embedder.config.requests_per_second = 0
+
+    async def create(input: list[str], model: str, **kwargs: Any) -> MagicMock:
+        mock_result = MagicMock()
+        mock_result.data = [create_openai_embedding(float(text.split()[-1])) for text in input]
+        return mock_result
+
+    mock_openai_client.embeddings.create.side_effect = create
+    input_batch = [f'Input {i}' for i in range(5)]
+
+    result = await openai_embedder.create_batch(input_batch)
+
+    # Verify one request is issued per chunk, with inputs spread evenly across chunks
+    assert mock_openai_client.embeddings.create.call_count == 3
+    chunk_sizes = sorted(
+        len(call.kwargs['input']) for call in mock_openai_client.embeddings.create.call_args_list
+    )
+    assert chunk_sizes == [1, 2, 2]
+
+    # Verify results are reassembled in input order
+    assert len(result) == 5
+    assert [embedding[0] for embedding in result] == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+
+@pytest.mark.asyncio
+async def test_create_batch_balances_chunk_sizes(
+    openai_embedder: OpenAIEmbedder, mock_openai_client: Any
+) -> None:
+    """Test that a small remainder is spread across chunks instead of sent as a tail request."""
+    openai_embedder.config.max_batch_size = 4
+
+    async def create(input: list[str], model: str, **kwargs: Any) -> MagicMock:
+        mock_result = MagicMock()
+        mock_result.data = [create_openai_embedding() for _ in input]
+        return mock_result
+
+    mock_openai_client.embeddings.create.side_effect = create
+
+    result = await openai_embedder.create_batch([f'Input {i}' for i in range(5)])
+
+    assert len(result) == 5
+    chunk_sizes = sorted(
+        len(call.kwargs['input']) for call in mock_openai_client.embeddings.create.call_args_list
+    )
+    assert chunk_sizes == [2, 3]
+
+
+@pytest.mark.asyncio
+async def test_create_batch_packs_chunks_by_token_budget(
+    openai_embedder: OpenAIEmbedder, mock_openai_client: Any
+) -> None:
+    """Test that chunks are split further when they would exceed max_tokens_per_request."""
+    openai_embedder.config.max_tokens_per_request = 10
+
+    async def create(input: list[str], model: str, **kwargs: Any) -> MagicMock:
+        mock_result = MagicMock()
+        mock_result.data = [create_openai_embedding() for _ in input]
+        return mock_result
+
+    mock_openai_client.embeddings.create.side_effect = create
+
+    with patch('graphiti_core.embedder.openai.TIKTOKEN_AVAILABLE', False):
+        result = await openai_embedder.create_batch([f'txt{i}' for i in range(5)])
+
+    assert len(result) == 5
+    chunk_sizes = [
+        len(call.kwargs['input']) for call in mock_openai_client.embeddings.create.call_args_list
+    ]
+    assert sorted(chunk_sizes) == [1, 2, 2]
+
+
+@pytest.mark.asyncio
+async def test_create_batch_falls_back_when_tokenizer_unavailable(
+    openai_embedder: OpenAIEmbedder, mock_openai_client: Any
+) -> None:
+    """Test that a tokenizer that cannot be loaded falls back to UTF-8 byte counts."""
+    openai_embedder.config.max_tokens_per_request = 10
+
+    async def create(input: list[str], model: str, **kwargs: Any) -> MagicMock:
+        mock_result = MagicMock()
+        mock_result.data = [create_openai_embedding() for _ in input]
+        return mock_result
+
+    mock_openai_client.embeddings.create.side_effect = create
+
+    with (
+        patch('graphiti_core.embedder.openai.TIKTOKEN_AVAILABLE', True),
+        patch(
+            'graphiti_core.embedder.openai.tiktoken.encoding_for_model',
+            side_effect=OSError('no network'),
+            create=True,
+        ),
+    ):
+        result = await openai_embedder.create_batch([f'txt{i}' for i in range(5)])
+
+    assert len(result) == 5
+    chunk_sizes = [
+        len(call.kwargs['input']) for call in mock_openai_client.embeddings.create.call_args_list
+    ]
+    assert sorted(chunk_sizes) == [1, 2, 2]
+    assert openai_embedder._encoding is False
+
+
+@pytest.mark.asyncio
+async def test_create_batch_propagates_chunk_errors(
+    openai_embedder: OpenAIEmbedder, mock_openai_client: Any
+) -> None:
+    """Test that a failing chunk request aborts create_batch with the original error."""
+    openai_embedder.config.max_batch_size = 1
+    mock_openai_client.embeddings.create.side_effect = ValueError('boom')
+
+    with pytest.raises(ValueError, match='boom'):
+        await openai_embedder.create_batch([f'Input {i}' for i in range(20)])
+
+
+@pytest.mark.asyncio
+async def test_create_batch_retries_rate_limited_chunk(
+    openai_embedder: OpenAIEmbedder, mock_openai_client: Any, mock_openai_batch_response: MagicMock
+) -> None:
+    """Test that a rate-limited request is retried after the server's Retry-After delay."""
+    rate_limit_response = httpx.Response(
+        429,
+        headers={'retry-after': '2'},
+        request=httpx.Request('POST', 'https://api.openai.com/v1/embeddings'),
+    )
+    mock_openai_client.embeddings.create.side_effect = [
+        openai.RateLimitError('rate limited', response=rate_limit_response, body=None),
+        mock_openai_batch_response,
+    ]
+
+    with patch('graphiti_core.embedder.openai.asyncio.sleep', new=AsyncMock()) as mock_sleep:
+        result = await openai_embedder.create_batch(['Input 1', 'Input 2', 'Input 3'])
+
+    assert mock_openai_client.embeddings.create.call_count == 2
+    mock_sleep.assert_awaited_once_with(2.0)
+    assert len(result) == 3
+
+
+@pytest.mark.asyncio
+async def test_create_batch_np_returns_float32_array(
+    openai_embedder: OpenAIEmbedder, mock_openai_client: Any, mock_openai_batch_response: MagicMock
+) -> None:
+    """Test that create_batch_np packs the batch into a float32 array in input order."""
+    mock_openai_client.embeddings.create.return_value = mock_openai_batch_response
+
+    result = await openai_embedder.create_batch_np(['Input 1', 'Input 2', 'Input 3'])
+
+    assert result.dtype == np.float32
+    assert result.shape == (3, openai_embedder.config.embedding_dim)
+    assert result[:, 0].tolist() == pytest.approx([0.1, 0.2, 0.3])
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_waits_when_exhausted() -> None:
+    """Test that the token bucket only sleeps once its burst capacity is used up."""
+    bucket = _TokenBucket(requests_per_second=2)
+
+    with patch('graphiti_core.embedder.openai.asyncio.sleep', new=AsyncMock()) as mock_sleep:
+        await bucket.acquire()
+        await bucket.acquire()
+        mock_sleep.assert_not_called()
+
+        await bucket.acquire()
+        mock_sleep.assert_awaited_once()
+        assert 0 < mock_sleep.await_args.args[0] <= 0.5
+
+
+@pytest.mark.asyncio
+async def test_aclose_only_closes_owned_client(mock_openai_client: Any) -> None:
+    """Test that aclose leaves externally supplied clients open."""
+    mock_openai_client.close = AsyncMock()
+    config = OpenAIEmbedderConfig(api_key='test_api_key')
+
+    async with OpenAIEmbedder(config=config, client=mock_openai_client):
+        pass
+    mock_openai_client.close.assert_not_called()
+
+    embedder = OpenAIEmbedder(config=config)
+    embedder.client = mock_openai_client
+    await embedder.aclose()
+    mock_openai_client.close.assert_awaited_once()
+
+
+def test_owned_client_disables_sdk_retries() -> None:
+    """Test that the embedder's own client leaves retries to _call_with_retry."""
+    embedder = OpenAIEmbedder(config=OpenAIEmbedderConfig(api_key='test_api_key'))
+
+    assert embedder.client.max_retries == 0
+
+
 if __name__ == '__main__':
     pytest.main(['-xvs', __file__])
@@ -5,6 +5,7 @@ from pydantic import BaseModel
 
 from graphiti_core.llm_client.azure_openai_client import AzureOpenAILLMClient
 from graphiti_core.llm_client.config import LLMConfig
+from graphiti_core.prompts.models import Message
 
 
 class DummyResponses:
@@ -107,3 +108,50 @@ async def test_reasoning_fields_forwarded_for_supported_models():
 
     create_args = dummy_client.chat.completions.create_calls[0]
     assert 'temperature' not in create_args
+
+
+def test_structured_response_reuses_parsed_output():
+    client = AzureOpenAILLMClient(azure_client=DummyAzureClient(), config=LLMConfig())
+    response = SimpleNamespace(
+        output_text='{"foo": "ignored"}', output_parsed=DummyResponseModel(foo='bar')
+    )
+
+    assert client._handle_structured_response(response) == {'foo': 'bar'}
+
+
+@pytest.mark.asyncio
+async def test_prompt_name_forwarded_as_prompt_cache_key():
+    dummy_client = DummyAzureClient()
+    client = AzureOpenAILLMClient(
+        azure_client=dummy_client, config=LLMConfig(use_prompt_cache_key=True)
+    )
+
+    await client.generate_response(
+        [Message(role='system', content='System'), Message(role='user', content='User')],
+        response_model=DummyResponseModel,
+        prompt_name='extract_nodes.extract_message',
+    )
+    await client.generate_response([Message(role='user', content='User')])
+
+    parse_args = dummy_client.responses.parse_calls[0]
+    assert parse_args['extra_body'] == {'prompt_cache_key': 'extract_nodes.extract_message'}
+    create_args = dummy_client.chat.completions.create_calls[0]
+    assert 'extra_body' not in create_args
+
+
+@pytest.mark.asyncio
+async def test_prompt_cache_key_omitted_by_default():
+    dummy_client = DummyAzureClient()
+    client = AzureOpenAILLMClient(azure_client=dummy_client, config=LLMConfig())
+
+    await client.generate_response(
+        [Message(role='user', content='User')],
+        response_model=DummyResponseModel,
+        prompt_name='extract_nodes.extract_message',
+    )
+    await client.generate_response(
+        [Message(role='user', content='User')], prompt_name='extract_nodes.extract_message'
+    )
+
+    assert 'extra_body' not in dummy_client.responses.parse_calls[0]
+    assert 'extra_body' not in dummy_client.chat.completions.create_calls[0]
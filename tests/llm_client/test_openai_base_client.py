@@ -0,0 +1,327 @@
+import asyncio
+import contextlib
+from types import SimpleNamespace
+
+import pytest
+from openai._constants import DEFAULT_TIMEOUT
+from pydantic import BaseModel
+
+from graphiti_core.llm_client.config import LLMConfig, ModelSize
+from graphiti_core.llm_client.deepseek_client import DeepSeekClient
+from graphiti_core.llm_client.openai_base_client import BaseOpenAIClient, _schema_instruction
+from graphiti_core.llm_client.qwen_client import QwenClient
+from graphiti_core.prompts.models import Message
+
+
+class DummyChatCompletions:
+    def __init__(self):
+        self.create_calls: list[dict] = []
+        message = SimpleNamespace(content='{}')
+        self.response = SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    async def create(self, **kwargs):
+        self.create_calls.append(kwargs)
+        return self.response
+
+
+class DummyChat:
+    def __init__(self):
+        self.completions = DummyChatCompletions()
+
+
+class DummyOpenAIClient:
+    def __init__(self):
+        self.chat = DummyChat()
+
+
+class DummyStream:
+    def __init__(self, pieces: list[str]):
+        self.pieces = pieces
+        self.closed = False
+
+    async def __aiter__(self):
+        for piece in self.pieces:
+            delta = SimpleNamespace(content=piece)
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+    async def close(self):
+        self.closed = True
+
+
+class DummyResponseModel(BaseModel):
+    foo: str
+
+
+class DictCache(dict):
+    """In-memory stand-in for the diskcache.Cache used by LLM clients."""
+
+    def set(self, key, value):
+        self[key] = value
+
+
+class ChatJSONClient(BaseOpenAIClient):
+    """Minimal BaseOpenAIClient that sends every request as a JSON-mode chat completion."""
+
+    def __init__(self, config: LLMConfig, client: DummyOpenAIClient):
+        super().__init__(config)
+        self.client = client  # type: ignore[assignment]
+
+    async def _create_completion(
+        self,
+        model,
+        messages,
+        temperature,
+        max_tokens,
+        response_model=None,
+        prompt_cache_key=None,
+    ):
+        return await self._chat_json(
+            model, messages, temperature, max_tokens, prompt_cache_key=prompt_cache_key
+        )
+
+    async def _create_structured_completion(
+        self,
+        model,
+        messages,
+        temperature,
+        max_tokens,
+        response_model,
+        reasoning,
+        verbosity,
+        prompt_cache_key=None,
+    ):
+        return await self._create_completion(
+            model, messages, temperature, max_tokens, prompt_cache_key=prompt_cache_key
+        )
+
+
+@pytest.fixture
+def mock_openai_client():
+    return DummyOpenAIClient()
+
+
+@pytest.fixture
+def client(mock_openai_client):
+    return ChatJSONClient(LLMConfig(api_key='test', model='test-model'), mock_openai_client)
+
+
+@pytest.mark.asyncio
+async def test_generate_response_keeps_system_prompt_prefix(client, mock_openai_client):
+    """Test that the language instruction is sent separately, leaving the system prompt intact."""
+    messages = [Message(role='system', content='System'), Message(role='user', content='Hi')]
+
+    await client.generate_response(messages=messages)
+
+    assert messages[0].content == 'System'
+    assert len(messages) == 2
+    sent_messages = mock_openai_client.chat.completions.create_calls[0]['messages']
+    assert sent_messages[0] == {'role': 'system', 'content': 'System'}
+    assert sent_messages[1]['role'] == 'system'
+    assert 'same language' in sent_messages[1]['content']
+    assert sent_messages[-1] == {'role': 'user', 'content': 'Hi'}
+
+
+@pytest.mark.asyncio
+async def test_generate_responses_returns_results_in_order(client, mock_openai_client):
+    """Test that batched requests return one result per prompt, in order."""
+    batch = [
+        ([Message(role='system', content='System'), Message(role='user', content=f'Hi {i}')], None)
+        for i in range(3)
+    ]
+
+    results = await client.generate_responses(batch, concurrency=2)
+
+    assert results == [{}, {}, {}]
+    assert len(mock_openai_client.chat.completions.create_calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_requests_bounded_by_max_concurrent_requests(mock_openai_client):
+    """Test that concurrent callers share the client's max_concurrent_requests limit."""
+    client = ChatJSONClient(
+        LLMConfig(api_key='test', max_concurrent_requests=2), mock_openai_client
+    )
+    in_flight = 0
+    max_in_flight = 0
+
+    async def create(**kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content='{}'))])
+
+    mock_openai_client.chat.completions.create = create
+
+    await asyncio.gather(
+        *(
+            client.generate_response([Message(role='user', content='hi')], max_tokens=8)
+            for _ in range(5)
+        )
+    )
+
+    assert max_in_flight == 2
+
+
+def test_convert_messages_does_not_mutate_input(client):
+    """Test that message cleaning does not write back onto caller-owned messages."""
+    message = Message(role='user', content='Hello\u200b world')
+
+    converted = client._convert_messages_to_openai_format([message])
+
+    assert converted == [{'role': 'user', 'content': 'Hello world'}]
+    assert message.content == 'Hello\u200b world'
+
+
+@pytest.mark.asyncio
+async def test_stream_response_yields_items_as_they_complete(client, mock_openai_client):
+    """Test that list items are decoded incrementally from a chunked stream."""
+    content = '{"extracted_entities": [{"name": "Alice, \\"A\\""}, {"name": "Bob"}, 42]}'
+    pieces = [content[i : i + 5] for i in range(0, len(content), 5)]
+    requests = []
+
+    async def create(**kwargs):
+        requests.append(kwargs)
+        return DummyStream(pieces)
+
+    mock_openai_client.chat.completions.create = create
+
+    items = []
+    async for item in client.stream_response([Message(role='user', content='Extract entities')]):
+        items.append(item)
+
+    assert items == [{'name': 'Alice, "A"'}, {'name': 'Bob'}, 42]
+    assert requests[0]['stream'] is True
+    assert 'same language' in requests[0]['messages'][0]['content']
+    assert requests[0]['messages'][-1] == {'role': 'user', 'content': 'Extract entities'}
+
+
+@pytest.mark.asyncio
+async def test_stream_response_uses_provider_request_setup(mock_openai_client):
+    """Test that streaming uses the provider cap and cache key, and closes an abandoned stream."""
+    config = LLMConfig(api_key='test', use_prompt_cache_key=True)
+    client = DeepSeekClient(config=config, client=mock_openai_client, max_tokens=16384)
+    stream = DummyStream(['{"items": [1, 2, 3]}'])
+    requests = []
+
+    async def create(**kwargs):
+        requests.append(kwargs)
+        return stream
+
+    mock_openai_client.chat.completions.create = create
+
+    async with contextlib.aclosing(
+        client.stream_response([Message(role='user', content='Hi')], prompt_name='extract')
+    ) as items:
+        async for item in items:
+            assert item == 1
+            break
+
+    assert requests[0]['max_tokens'] == 8192
+    assert requests[0]['extra_body'] == {'prompt_cache_key': 'extract'}
+    assert stream.closed
+    assert client._semaphore._value == config.max_concurrent_requests
+
+
+@pytest.mark.asyncio
+async def test_generate_response_bounds_logged_errors(client, mock_openai_client, caplog):
+    """Test that error logs do not dump arbitrarily large error text."""
+
+    async def create(**kwargs):
+        raise ValueError('x' * 10_000)
+
+    mock_openai_client.chat.completions.create = create
+
+    with pytest.raises(ValueError):
+        await client.generate_response([Message(role='user', content='Hi')])
+
+    assert caplog.records
+    assert all(len(record.getMessage()) < 1000 for record in caplog.records)
+
+
+def test_response_cache_key_includes_temperature(client):
+    """Test that responses sampled at different temperatures are cached separately."""
+    messages = [Message(role='user', content='Hi')]
+    key = client._get_response_cache_key(messages, None, 64, ModelSize.medium)
+
+    client.temperature = 0.0
+
+    assert client._get_response_cache_key(messages, None, 64, ModelSize.medium) != key
+
+
+@pytest.mark.asyncio
+async def test_generate_response_uses_response_cache(client, mock_openai_client):
+    """Test that identical requests are served from the response cache."""
+    client.cache_enabled = True
+    client.cache_dir = DictCache()
+
+    first = await client.generate_response(
+        messages=[Message(role='system', content='System'), Message(role='user', content='Hi')]
+    )
+    second = await client.generate_response(
+        messages=[Message(role='system', content='System'), Message(role='user', content='Hi')]
+    )
+
+    assert first == second == {}
+    assert len(mock_openai_client.chat.completions.create_calls) == 1
+
+
+@pytest.mark.parametrize('client_cls', [DeepSeekClient, QwenClient])
+@pytest.mark.asyncio
+async def test_schema_instruction_added_without_mutating_messages(client_cls, mock_openai_client):
+    """Test that providers without native structured output share the cached schema instruction."""
+    client = client_cls(config=LLMConfig(api_key='test'), client=mock_openai_client)
+    messages = [{'role': 'user', 'content': 'Extract entities'}]
+
+    await client._create_structured_completion(
+        model='test-model',
+        messages=messages,
+        temperature=0.4,
+        max_tokens=64,
+        response_model=DummyResponseModel,
+    )
+
+    instruction = _schema_instruction(DummyResponseModel)
+    assert 'Your response must be valid JSON that matches this schema' in instruction
+    assert '"foo"' in instruction
+    assert _schema_instruction(DummyResponseModel) is instruction
+    assert messages == [{'role': 'user', 'content': 'Extract entities'}]
+    sent_messages = mock_openai_client.chat.completions.create_calls[0]['messages']
+    assert sent_messages[-1]['content'] == 'Extract entities' + instruction
+
+
+@pytest.mark.parametrize('use_prompt_cache_key', [False, True])
+@pytest.mark.asyncio
+async def test_prompt_cache_key_is_opt_in(use_prompt_cache_key, mock_openai_client):
+    """Test that prompt_cache_key is only sent when enabled in the config."""
+    config = LLMConfig(api_key='test', use_prompt_cache_key=use_prompt_cache_key)
+    client = ChatJSONClient(config, mock_openai_client)
+
+    await client.generate_response(
+        [Message(role='user', content='Hi')], prompt_name='extract_nodes.extract_message'
+    )
+
+    extra_body = mock_openai_client.chat.completions.create_calls[0]['extra_body']
+    if use_prompt_cache_key:
+        assert extra_body == {'prompt_cache_key': 'extract_nodes.extract_message'}
+    else:
+        assert extra_body is None
+
+
+@pytest.mark.parametrize('client_cls', [DeepSeekClient, QwenClient])
+@pytest.mark.asyncio
+async def test_aclose_closes_owned_pooled_client(client_cls):
+    """Test that provider clients own and close the pooled client they create."""
+    client = client_cls(config=LLMConfig(api_key='test'))
+    assert client.client._client.timeout == DEFAULT_TIMEOUT
+
+    async with client:
+        pass
+
+    assert client.client.is_closed()
+
+    # DummyOpenAIClient has no close(), so closing an external client would raise
+    external = DummyOpenAIClient()
+    async with client_cls(config=LLMConfig(api_key='test'), client=external):
+        pass
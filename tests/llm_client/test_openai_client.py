@@ -0,0 +1,121 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from openai._constants import DEFAULT_TIMEOUT
+from pydantic import BaseModel
+
+from graphiti_core.llm_client.config import LLMConfig
+from graphiti_core.llm_client.openai_client import OpenAIClient
+
+
+class DummyResponses:
+    def __init__(self):
+        self.parse_calls: list[dict] = []
+
+    async def parse(self, **kwargs):
+        self.parse_calls.append(kwargs)
+        return SimpleNamespace(output_text='{}')
+
+
+class DummyChatCompletions:
+    def __init__(self):
+        self.create_calls: list[dict] = []
+
+    async def create(self, **kwargs):
+        self.create_calls.append(kwargs)
+        message = SimpleNamespace(content='{}')
+        choice = SimpleNamespace(message=message)
+        return SimpleNamespace(choices=[choice])
+
+
+class DummyChat:
+    def __init__(self):
+        self.completions = DummyChatCompletions()
+
+
+class DummyOpenAIClient:
+    def __init__(self):
+        self.responses = DummyResponses()
+        self.chat = DummyChat()
+        self.close = AsyncMock()
+
+
+class DummyResponseModel(BaseModel):
+    foo: str
+
+
+@pytest.mark.asyncio
+async def test_structured_completion_request_kwargs():
+    dummy_client = DummyOpenAIClient()
+    client = OpenAIClient(config=LLMConfig(api_key='test'), client=dummy_client)
+
+    await client._create_structured_completion(
+        model='gpt-4.1',
+        messages=[],
+        temperature=0.4,
+        max_tokens=64,
+        response_model=DummyResponseModel,
+        reasoning='minimal',
+        verbosity='low',
+    )
+    await client._create_structured_completion(
+        model='gpt-5-mini',
+        messages=[],
+        temperature=0.4,
+        max_tokens=64,
+        response_model=DummyResponseModel,
+        reasoning='minimal',
+        verbosity='low',
+        prompt_cache_key='extract_nodes.extract_message',
+    )
+
+    standard_args, reasoning_args = dummy_client.responses.parse_calls
+    assert standard_args == {
+        'model': 'gpt-4.1',
+        'input': [],
+        'max_output_tokens': 64,
+        'text_format': DummyResponseModel,
+        'temperature': 0.4,
+    }
+    assert 'temperature' not in reasoning_args
+    assert reasoning_args['reasoning'] == {'effort': 'minimal'}
+    assert reasoning_args['text'] == {'verbosity': 'low'}
+    assert reasoning_args['extra_body'] == {'prompt_cache_key': 'extract_nodes.extract_message'}
+
+
+@pytest.mark.asyncio
+async def test_aclose_only_closes_owned_client():
+    dummy_client = DummyOpenAIClient()
+    async with OpenAIClient(config=LLMConfig(api_key='test'), client=dummy_client):
+        pass
+    dummy_client.close.assert_not_awaited()
+
+    client = OpenAIClient(config=LLMConfig(api_key='test'))
+    client.client.close = AsyncMock()
+    await client.aclose()
+    client.client.close.assert_awaited_once()
+
+
+def test_responses_client_shares_connection_pool():
+    config = LLMConfig(
+        api_key='test',
+        base_url='https://chat.example.com/v1',
+        responses_url='https://responses.example.com/v1',
+    )
+    client = OpenAIClient(config=config)
+
+    assert client.responses_client is not client.client
+    assert str(client.responses_client.base_url) == 'https://responses.example.com/v1/'
+    assert client.responses_client._client is client.client._client
+
+    shared = OpenAIClient(config=LLMConfig(api_key='test'))
+    assert shared.responses_client is shared.client
+
+
+def test_owned_client_keeps_sdk_http_defaults():
+    client = OpenAIClient(config=LLMConfig(api_key='test'))
+    http_client = client.client._client
+
+    assert http_client.timeout == DEFAULT_TIMEOUT
+    assert http_client.follow_redirects is True
@@ -41,12 +41,12 @@ class DummyResponses:
 class DummyChatCompletions:
     def __init__(self):
         self.create_calls: list[dict] = []
+        message = SimpleNamespace(content='{}')
+        self.response = SimpleNamespace(choices=[SimpleNamespace(message=message)])
 
     async def create(self, **kwargs):
         self.create_calls.append(kwargs)
-        message = SimpleNamespace(content='{}')
-        choice = SimpleNamespace(message=message)
-        return SimpleNamespace(choices=[choice])
+        return self.response
 
 
 class DummyChat:
@@ -126,7 +126,7 @@ class TestQwenClientInitialization:
 
 @pytest.mark.asyncio
 async def test_create_structured_completion_strips_reasoning_for_non_reasoning_models(qwen_client, mock_openai_client):
-    """Test that reasoning/verbosity parameters are stripped for non-reasoning models."""
+    """Test that structured completions use chat completions without reasoning parameters."""
     await qwen_client._create_structured_completion(
         model='qwen-turbo',
         messages=[],
@@ -137,13 +137,15 @@ async def test_create_structured_completion_strips_reasoning_for_non_reasoning_m
         verbosity='low',
     )
 
-    assert len(mock_openai_client.responses.parse_calls) == 1
-    call_args = mock_openai_client.responses.parse_calls[0]
+    # Qwen has no responses.parse endpoint, so the request goes to chat completions
+    assert mock_openai_client.responses.parse_calls == []
+    assert len(mock_openai_client.chat.completions.create_calls) == 1
+    call_args = mock_openai_client.chat.completions.create_calls[0]
     assert call_args['model'] == 'qwen-turbo'
-    assert call_args['input'] == []
-    assert call_args['max_output_tokens'] == 64
-    assert call_args['text_format'] is DummyResponseModel
+    assert call_args['messages'] == []
+    assert call_args['max_tokens'] == 64
     assert call_args['temperature'] == 0.4
+    assert call_args['response_format'] == {'type': 'json_object'}
     # Qwen models don't support reasoning/verbosity parameters
     assert 'reasoning' not in call_args
     assert 'text' not in call_args
@@ -170,10 +172,11 @@ async def test_create_completion_with_json_format(qwen_client, mock_openai_clien
 
 @pytest.mark.asyncio
 async def test_generate_response_with_response_model(qwen_client, mock_openai_client):
-    """Test generate_response with a response model."""
-    # Mock the structured completion response
-    mock_response = SimpleNamespace(output_text='{"foo": "bar"}')
-    mock_openai_client.responses.parse.return_value = mock_response
+    """Test generate_response with a response model goes straight to chat completions."""
+    message = SimpleNamespace(content='{"foo": "bar"}')
+    mock_openai_client.chat.completions.response = SimpleNamespace(
+        choices=[SimpleNamespace(message=message)]
+    )
 
     messages = [Message(role='user', content='Test message')]
     result = await qwen_client.generate_response(
@@ -182,7 +185,8 @@ async def test_generate_response_with_response_model(qwen_client, mock_openai_cl
     )
 
     assert result == {'foo': 'bar'}
-    assert len(mock_openai_client.responses.parse_calls) == 1
+    assert len(mock_openai_client.chat.completions.create_calls) == 1
+    assert mock_openai_client.responses.parse_calls == []
 
 
 @pytest.mark.asyncio
@@ -191,8 +195,7 @@ async def test_generate_response_without_response_model(qwen_client, mock_openai
     # Mock the regular completion response
     message = SimpleNamespace(content='{"result": "success"}')
     choice = SimpleNamespace(message=message)
-    mock_response = SimpleNamespace(choices=[choice])
-    mock_openai_client.chat.completions.create.return_value = mock_response
+    mock_openai_client.chat.completions.response = SimpleNamespace(choices=[choice])
 
     messages = [Message(role='user', content='Test message')]
     result = await qwen_client.generate_response(messages=messages)